@@ -1,24 +1,59 @@
-a = [0,1,2,2,1,0,1,0,2,1,1,0,2,1,0,1,0]
-zeros = []
-ones = []
-twos = []
-new = []
-
-for i in range(0, len(a)):
-    if a[i] == 0:
-        zeros.append(a[i])
-    elif a[i] == 1:
-        ones.append(a[i])
-    elif a[i] == 2:
-        twos.append(a[i])
-
-for i in range(0, len(zeros)):
-    new.append(zeros[i])
-
-for i in range(0, len(ones)):
-    new.append(ones[i])
-
-for i in range(0, len(twos)):
-    new.append(twos[i])
-
-print("Old array:\n", a, "\nThe new array with zeros at the end looks like this:\n", new)
\ No newline at end of file
+import array
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def dutchflag(a, low=0, mid=1, high=2):
+    # one pass, in place: a[:lo] holds low, a[lo:i] mid and a[hi + 1:] high
+    lo = 0
+    i = 0
+    hi = len(a) - 1
+    while i <= hi:
+        value = a[i]
+        if value == low:
+            a[lo], a[i] = a[i], a[lo]
+            lo += 1
+            i += 1
+        elif value == mid:
+            i += 1
+        elif value == high:
+            a[i], a[hi] = a[hi], a[i]
+            hi -= 1
+        else:
+            raise ValueError('unexpected value ' + repr(value))
+    return a
+
+
+def countingsort(a, k=None):
+    # sorts small non-negative integers (below k) in place with one counting
+    # pass and O(k) extra memory for the counts
+    if np is not None and isinstance(a, np.ndarray):
+        counts = np.bincount(a.ravel(), minlength=k or 0)
+        if k is not None and len(counts) > k:
+            raise ValueError('values must be below ' + str(k))
+        # a[...] writes into a itself, ravel() may be a copy when a is not contiguous
+        a[...] = np.repeat(np.arange(len(counts), dtype=a.dtype), counts).reshape(a.shape)
+        return a
+    counts = Counter(a)
+    if counts and (min(counts) < 0 or (k is not None and max(counts) >= k)):
+        raise ValueError('values must be between 0 and ' + str(k))
+    position = 0
+    for value in sorted(counts):
+        count = counts[value]
+        if isinstance(a, array.array):
+            a[position:position + count] = array.array(a.typecode, [value]) * count
+        else:
+            a[position:position + count] = [value] * count
+        position += count
+    return a
+
+
+if __name__ == "__main__":
+    a = [0,1,2,2,1,0,1,0,2,1,1,0,2,1,0,1,0]
+    new = dutchflag(list(a))
+
+    print("Old array:\n", a, "\nThe new array with zeros at the end looks like this:\n", new)
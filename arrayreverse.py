@@ -1,5 +1,12 @@
 # Program to reverse an array in the group of 'n.'
 
+import mmap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Accept array, its size and group size
 
 def reverse(a, a_size, n):
@@ -8,32 +15,74 @@ def reverse(a, a_size, n):
 
     while(temp<a_size):
 
-     start = temp
+        start = temp
 
 # When a_size/n is not divisible
 
-     end = min(temp + n - 1, a_size - 1)
+        end = min(temp + n - 1, a_size - 1)
 
 # Reverse the sub-array [start, right]
 
-    while (start < end):
+        while (start < end):
+
+            a[start], a[end] = a[end], a[start]
+
+            start+= 1
+
+            end-=1
+
+        temp+= n
+
 
-        a[start], a[end] = a[end], a[start]
+def reversegroups(a, n):
+    # same result as reverse, one slice assignment per group for lists and
+    # one reshape and flip for numpy arrays that split into whole groups
+    if n < 1:
+        raise ValueError('group size must be at least 1')
+    size = len(a)
+    if np is not None and isinstance(a, np.ndarray):
+        whole = size - size % n
+        if whole:
+            body = a[:whole].reshape(-1, n, *a.shape[1:])
+            body[:] = body[:, ::-1].copy()
+        if whole < size:
+            a[whole:] = a[whole:][::-1].copy()
+        return a
+    for start in range(0, size, n):
+        a[start:start + n] = a[start:start + n][::-1]
+    return a
 
-        start+= 1
 
-        end-=1
+def reverserecords(path, recordsize, n):
+    # reverse the fixed size records of a binary file in groups of n, in
+    # place through mmap so only one group is copied at a time
+    with open(path, 'r+b') as file:
+        file.seek(0, 2)
+        filesize = file.tell()
+        if filesize % recordsize:
+            raise ValueError('file size is not a whole number of records')
+        if filesize == 0:
+            return
+        with mmap.mmap(file.fileno(), 0) as data:
+            groupsize = recordsize * n
+            for start in range(0, filesize, groupsize):
+                end = min(start + groupsize, filesize)
+                group = data[start:end]
+                records = [group[i:i + recordsize] for i in range(0, len(group), recordsize)]
+                records.reverse()
+                data[start:end] = b''.join(records)
+            data.flush()
 
-    temp+= n
 
-a = [5,23,5,23,1,23,5,136,7,56]
+if __name__ == "__main__":
+    a = [5,23,5,23,1,23,5,136,7,56]
 
-n = 2
+    n = 2
 
-a_size = len(a)
+    a_size = len(a)
 
-reverse(a, a_size, n)
+    reverse(a, a_size, n)
 
-for i in range(0, a_size):
+    for i in range(0, a_size):
 
- print(a[i], end =" ")
\ No newline at end of file
+        print(a[i], end =" ")
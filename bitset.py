@@ -0,0 +1,192 @@
+import array
+from bisect import bisect_right
+from itertools import accumulate
+
+from numberofbits import POPCOUNT_TABLE
+
+# bits per directory block
+BLOCK_BITS = 512
+BLOCK_BYTES = BLOCK_BITS // 8
+
+
+def lowestbit(number):
+    # position of the lowest set bit, -1 for 0
+    return (number & -number).bit_length() - 1
+
+
+class Bitset:
+    # one bit per entry in a bytearray, bit i is bit i % 8 of byte i // 8.
+    # a count of set bits per 512 bit block gives rank/select and lets
+    # searches skip empty or full blocks. `free` is the lowest block that
+    # may still have a clear bit, every block before it is full, and the
+    # rank directory is only stale from block `stale` onward
+
+    def __init__(self, size):
+        if size < 0:
+            raise ValueError('size must not be negative')
+        self.size = size
+        blocks = (size + BLOCK_BITS - 1) // BLOCK_BITS
+        self.bits = bytearray(blocks * BLOCK_BYTES)
+        self.counts = array.array('H', bytes(2 * blocks))
+        self.ranks = array.array('Q', bytes(8 * (blocks + 1)))
+        self.stale = 0
+        self.free = 0
+
+    @classmethod
+    def frombytes(cls, data, size=None):
+        bitset = cls(len(data) * 8 if size is None else size)
+        # bits past size are dropped so the buffer matches the block counts
+        data = data[:len(bitset.bits)]
+        bitset.bits[:len(data)] = data
+        bitset.clearpadding()
+        bitset.recount()
+        return bitset
+
+    def __len__(self):
+        return self.size
+
+    def check(self, i):
+        if not 0 <= i < self.size:
+            raise IndexError('bit ' + str(i) + ' out of range')
+
+    def test(self, i):
+        self.check(i)
+        return bool(self.bits[i >> 3] >> (i & 7) & 1)
+
+    __getitem__ = test
+
+    def set(self, i):
+        self.check(i)
+        mask = 1 << (i & 7)
+        if not self.bits[i >> 3] & mask:
+            self.bits[i >> 3] |= mask
+            block = i // BLOCK_BITS
+            self.counts[block] += 1
+            self.stale = min(self.stale, block)
+
+    def clear(self, i):
+        self.check(i)
+        mask = 1 << (i & 7)
+        if self.bits[i >> 3] & mask:
+            self.bits[i >> 3] &= ~mask
+            block = i // BLOCK_BITS
+            self.counts[block] -= 1
+            self.stale = min(self.stale, block)
+            self.free = min(self.free, block)
+
+    def count(self):
+        return sum(self.counts)
+
+    def recount(self):
+        for block in range(len(self.counts)):
+            start = block * BLOCK_BYTES
+            self.counts[block] = sum(self.bits[start:start + BLOCK_BYTES].translate(POPCOUNT_TABLE))
+        self.stale = 0
+        self.free = 0
+
+    def clearpadding(self):
+        extra = len(self.bits) * 8 - self.size
+        if extra:
+            whole = int.from_bytes(self.bits, 'little') & ((1 << self.size) - 1)
+            self.bits[:] = whole.to_bytes(len(self.bits), 'little')
+
+    def combine(self, other, operation):
+        if self.size != other.size:
+            raise ValueError('bitsets must have the same size')
+        result = Bitset(self.size)
+        whole = operation(int.from_bytes(self.bits, 'little'), int.from_bytes(other.bits, 'little'))
+        result.bits[:] = whole.to_bytes(len(self.bits), 'little')
+        result.recount()
+        return result
+
+    def union(self, other):
+        return self.combine(other, lambda a, b: a | b)
+
+    def intersection(self, other):
+        return self.combine(other, lambda a, b: a & b)
+
+    def difference(self, other):
+        return self.combine(other, lambda a, b: a & ~b)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def block(self, block):
+        start = block * BLOCK_BYTES
+        return int.from_bytes(self.bits[start:start + BLOCK_BYTES], 'little')
+
+    def findfirstset(self):
+        # first set bit or -1, the block is found from the counts and the bit
+        # inside it with n & -n
+        for block, count in enumerate(self.counts):
+            if count:
+                return block * BLOCK_BITS + lowestbit(self.block(block))
+        return -1
+
+    def findfirstclear(self):
+        # starts at the free cursor and moves it past the full blocks it finds
+        counts = self.counts
+        block = self.free
+        while block < len(counts) and counts[block] == BLOCK_BITS:
+            block += 1
+        self.free = block
+        if block == len(counts):
+            return -1
+        free = ~self.block(block) & ((1 << BLOCK_BITS) - 1)
+        position = block * BLOCK_BITS + lowestbit(free)
+        return position if position < self.size else -1
+
+    def allocate(self):
+        # takes the lowest free slot, -1 when the bitset is full
+        position = self.findfirstclear()
+        if position >= 0:
+            self.set(position)
+        return position
+
+    def directory(self):
+        # set bits before every block. a change in block b only moves the
+        # entries after b, so only those are summed again
+        stale = self.stale
+        if stale < len(self.counts):
+            ranks = self.ranks
+            ranks[stale + 1:] = array.array('Q', accumulate(self.counts[stale:], initial=ranks[stale]))[1:]
+            self.stale = len(self.counts)
+        return self.ranks
+
+    def rank(self, i):
+        # number of set bits before position i
+        if not 0 <= i <= self.size:
+            raise IndexError('position ' + str(i) + ' out of range')
+        block, offset = divmod(i, BLOCK_BITS)
+        if block == len(self.counts):
+            return self.directory()[block]
+        inside = self.block(block) & ((1 << offset) - 1)
+        return self.directory()[block] + inside.bit_count()
+
+    def select(self, k):
+        # position of the set bit with rank k (the k + 1 th set bit)
+        ranks = self.directory()
+        if not 0 <= k < ranks[-1]:
+            raise IndexError('there is no set bit with rank ' + str(k))
+        block = bisect_right(ranks, k) - 1
+        k -= ranks[block]
+        position = block * BLOCK_BITS
+        for byte in self.bits[block * BLOCK_BYTES:(block + 1) * BLOCK_BYTES]:
+            ones = POPCOUNT_TABLE[byte]
+            if k < ones:
+                for _ in range(k):
+                    byte &= byte - 1
+                return position + lowestbit(byte)
+            k -= ones
+            position += 8
+
+    def __iter__(self):
+        # positions of the set bits in order
+        for block, count in enumerate(self.counts):
+            if count:
+                word = self.block(block)
+                while word:
+                    low = word & -word
+                    yield block * BLOCK_BITS + low.bit_length() - 1
+                    word ^= low
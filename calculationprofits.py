@@ -1,10 +1,135 @@
+import array
+import csv
+import os
+from functools import partial
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def calculateprofits(arr,arr_size):
     profit=0
     for i in range(1,arr_size):
         if arr[i]>arr[i-1]:
             profit+=arr[i]-arr[i-1]
 
-        return profit
-pricesofsevendays=[635,678,890,2345,768,654,123]
-profit = calculateprofits(pricesofsevendays,len(pricesofsevendays))
-print('max profit :',profit)
+    return profit
+
+
+def unlimitedprofit(prices, cooldown=False, fee=0):
+    # hold is the best cash while owning a share, cash while not owning one.
+    # with cooldown a buy has to use the cash from two days back
+    hold = None
+    cash = 0
+    before = 0
+    for price in prices:
+        if hold is None:
+            hold = -price
+            before, cash = cash, cash
+            continue
+        newhold = max(hold, (before if cooldown else cash) - price)
+        before, cash = cash, max(cash, hold + price - fee)
+        hold = newhold
+    return cash
+
+
+def kprofit(prices, k, cooldown=False, fee=0):
+    # at most k transactions: buy[j] and sell[j] are the best cash during and
+    # after the j+1 th transaction, all k updated together for every price
+    if k <= 0:
+        return 0
+    if np is not None:
+        # the state keeps the prices' type, int64 for whole prices so big
+        # totals stay exact, with a very low start instead of -inf
+        prices = np.asarray(prices)
+        if prices.dtype.kind in 'iub' and isinstance(fee, int):
+            dtype, lowest = np.int64, np.iinfo(np.int64).min // 2
+        else:
+            dtype, lowest = np.float64, -np.inf
+        buy = np.full(k, lowest, dtype=dtype)
+        sell = np.zeros(k, dtype=dtype)
+        before = np.zeros(k, dtype=dtype)
+        start = np.zeros(1, dtype=dtype)
+        for price in prices.astype(dtype):
+            previous = sell if not cooldown else before
+            opened = np.concatenate((start, previous[:-1])) - price
+            newbuy = np.maximum(buy, opened)
+            before = sell
+            sell = np.maximum(sell, buy + price - fee)
+            buy = newbuy
+        return max(sell.max().item(), 0)
+    buy = [float('-inf')] * k
+    sell = [0] * k
+    before = [0] * k
+    for price in prices:
+        previous = sell if not cooldown else before
+        newbuy = [max(buy[j], (previous[j - 1] if j else 0) - price) for j in range(k)]
+        before = sell
+        sell = [max(sell[j], buy[j] + price - fee) for j in range(k)]
+        buy = newbuy
+    return max(max(sell), 0)
+
+
+def maxprofit(prices, k=None, cooldown=False, fee=0):
+    # k=None means any number of transactions
+    if k is not None and k < len(prices) // 2 + 1:
+        return kprofit(prices, k, cooldown, fee)
+    return unlimitedprofit(prices, cooldown, fee)
+
+
+def loadprices(path, column=-1):
+    # prices from a csv file (column by name or position, header optional),
+    # a .npy file or a raw file of float64 values
+    if path.endswith('.csv'):
+        prices = array.array('d')
+        with open(path, newline='') as file:
+            reader = csv.reader(file)
+            for row in reader:
+                if not row:
+                    continue
+                if isinstance(column, str):
+                    column = row.index(column)
+                    continue
+                try:
+                    prices.append(float(row[column]))
+                except ValueError:
+                    # header line
+                    continue
+        return prices
+    if path.endswith('.npy'):
+        # the .npy header would be read as prices by the raw reader below
+        if np is None:
+            raise ImportError('numpy is needed to read ' + path)
+        return np.load(path)
+    prices = array.array('d')
+    with open(path, 'rb') as file:
+        prices.frombytes(file.read())
+    return prices
+
+
+def tickerprofit(job, k=None, cooldown=False, fee=0):
+    name, prices = job
+    if isinstance(prices, str):
+        prices = loadprices(prices)
+    return name, maxprofit(prices, k, cooldown, fee)
+
+
+def backtest(tickers, k=None, cooldown=False, fee=0, workers=None):
+    # tickers maps a name to a price series or a file path, every ticker is
+    # worked out in its own process. returns name -> best profit
+    work = partial(tickerprofit, k=k, cooldown=cooldown, fee=fee)
+    jobs = list(tickers.items())
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        return dict(map(work, jobs))
+    with Pool(workers) as pool:
+        return dict(pool.imap_unordered(work, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+
+if __name__ == "__main__":
+    pricesofsevendays=[635,678,890,2345,768,654,123]
+    profit = calculateprofits(pricesofsevendays,len(pricesofsevendays))
+    print('max profit :',profit)
@@ -1,3 +1,9 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def computepower(x,y):
     result=1
 
@@ -10,6 +16,120 @@ def computepower(x,y):
             y=y-1
 
     return result
-x=int(input('enter x for x^y'))
-y = int(input('enter y for x^y'))
-print('total: ',(computepower(x,y)))
\ No newline at end of file
+
+
+def modpower(x, y, m):
+    # x^y mod m. the built-in three argument pow does the same square and
+    # multiply in C, is faster than any python loop, and handles negative y
+    # through the modular inverse (ValueError when there is none)
+    return pow(x, y, m)
+
+
+def windowpower(x, y, m=None, window=None):
+    # sliding window: odd powers x, x^3 ... x^(2^w - 1) are made once, then
+    # the exponent is read left to right w bits at a time, which saves most
+    # of the multiplications for long exponents. kept as a reference of the
+    # method, it is slower than pow in python: about 2x at 64 bit exponents
+    # and only even with pow around 2048 bits
+    if y < 0:
+        if m:
+            return pow(x, y, m)
+        raise ValueError('negative exponent needs a modulus')
+    if y == 0:
+        return 1 % m if m else 1
+    if window is None:
+        window = max(1, min(6, y.bit_length().bit_length() - 2))
+    reduce = (lambda v: v % m) if m else (lambda v: v)
+    x = reduce(x)
+    square = reduce(x * x)
+    odd = [x]
+    for i in range(1, 1 << (window - 1)):
+        odd.append(reduce(odd[-1] * square))
+
+    result = 1
+    i = y.bit_length() - 1
+    while i >= 0:
+        if not y >> i & 1:
+            result = reduce(result * result)
+            i -= 1
+            continue
+        # longest window ending in a set bit
+        low = max(i - window + 1, 0)
+        while not y >> low & 1:
+            low += 1
+        bits = (y >> low) & ((1 << (i - low + 1)) - 1)
+        for _ in range(i - low + 1):
+            result = reduce(result * result)
+        result = reduce(result * odd[bits >> 1])
+        i = low - 1
+    return result
+
+
+def matrixmultiply(a, b, m=None):
+    columns = list(zip(*b))
+    result = []
+    for row in a:
+        if m:
+            result.append([sum(p * q for p, q in zip(row, column)) % m for column in columns])
+        else:
+            result.append([sum(p * q for p, q in zip(row, column)) for column in columns])
+    return result
+
+
+def matrixpower(matrix, y, m=None):
+    # square matrix to the power y by square and multiply, mod m if given
+    if y < 0:
+        raise ValueError('exponent must not be negative')
+    size = len(matrix)
+    if any(len(row) != size for row in matrix):
+        raise ValueError('matrix must be square')
+    result = [[int(i == j) % m if m else int(i == j) for j in range(size)] for i in range(size)]
+    base = [[v % m for v in row] for row in matrix] if m else [list(row) for row in matrix]
+    while y > 0:
+        if y & 1:
+            result = matrixmultiply(result, base, m)
+        base = matrixmultiply(base, base, m)
+        y >>= 1
+    return result
+
+
+def recurrence(coefficients, initial, n, m=None):
+    # n th term of a(k) = c0*a(k-1) + c1*a(k-2) + ... from the first terms,
+    # through a power of the companion matrix
+    order = len(coefficients)
+    if len(initial) != order:
+        raise ValueError('need one initial term per coefficient')
+    if n < order:
+        return initial[n] % m if m else initial[n]
+    companion = [list(coefficients)] + [[int(j == i) for j in range(order)] for i in range(order - 1)]
+    power = matrixpower(companion, n - order + 1, m)
+    state = list(reversed(initial))
+    value = sum(p * q for p, q in zip(power[0], state))
+    return value % m if m else value
+
+
+# largest modulus whose products still fit in int64
+NUMPY_MODULUS_LIMIT = 3037000499
+
+
+def batchpower(bases, y, m):
+    # base^y mod m for every base of a list or numpy array with one exponent
+    if np is not None and isinstance(bases, np.ndarray) and 0 < m <= NUMPY_MODULUS_LIMIT and y >= 0:
+        x = np.asarray(bases, dtype=np.int64) % m
+        result = np.full(x.shape, 1 % m, dtype=np.int64)
+        while y > 0:
+            if y & 1:
+                result = result * x % m
+            x = x * x % m
+            y >>= 1
+        return result
+    result = [pow(int(b), y, m) for b in bases]
+    if np is not None and isinstance(bases, np.ndarray):
+        return np.array(result, dtype=object)
+    return result
+
+
+if __name__ == "__main__":
+    x=int(input('enter x for x^y'))
+    y = int(input('enter y for x^y'))
+    print('total: ',(computepower(x,y)))
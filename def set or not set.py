@@ -4,6 +4,13 @@ def setornot(number,n):
     else: 
         print('not set')
 
-number=int(input('enter number:'))
-n=int(input('enter bit number'))
-setornot(number,n)
\ No newline at end of file
+
+def setornotmany(bitset, positions):
+    # the same check for many bit numbers of one Bitset, counting from 1 like setornot
+    return [bitset.test(n - 1) for n in positions]
+
+
+if __name__ == "__main__":
+    number=int(input('enter number:'))
+    n=int(input('enter bit number'))
+    setornot(number,n)
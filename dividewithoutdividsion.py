@@ -1,3 +1,12 @@
+import sys
+import timeit
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def divide(ourdividend, ourDivisor):
   sign = (-1 if((ourdividend < 0) ^ (ourDivisor < 0)) else 1)
   ourdividend = abs(ourdividend)
@@ -13,6 +22,81 @@ def divide(ourdividend, ourDivisor):
     quotientNumber = -quotientNumber
   return quotientNumber
 
-a = int(input("Enter a for a/b: "))
-b = int(input("Enter b for a/b: "))
-print("Result of", a, "/", b, "is", divide(a, b))
+
+def dividemod(ourdividend, ourDivisor):
+  # quotient and remainder of any size of int. the loop only runs over the
+  # bits the quotient can have. like divide the quotient is truncated toward
+  # zero, so the remainder has the sign of the dividend
+  if ourDivisor == 0:
+    raise ZeroDivisionError('division by zero')
+  negative = (ourdividend < 0) ^ (ourDivisor < 0)
+  dividendsign = -1 if ourdividend < 0 else 1
+  remainder = abs(ourdividend)
+  ourDivisor = abs(ourDivisor)
+
+  quotientNumber = 0
+  for i in range(remainder.bit_length() - ourDivisor.bit_length(), -1, -1):
+    shifted = ourDivisor << i
+    if shifted <= remainder:
+      remainder -= shifted
+      quotientNumber |= 1 << i
+  if negative:
+    quotientNumber = -quotientNumber
+  return quotientNumber, dividendsign * remainder
+
+
+def dividebatch(dividends, divisors):
+  # dividemod on two int64 numpy arrays, every shift step is one array op.
+  # without numpy it falls back to dividemod for every pair
+  if np is None:
+    if not hasattr(divisors, '__len__'):
+      divisors = [divisors] * len(dividends)
+    pairs = [dividemod(a, b) for a, b in zip(dividends, divisors)]
+    return [q for q, r in pairs], [r for q, r in pairs]
+  dividends = np.asarray(dividends, dtype=np.int64)
+  divisors = np.asarray(divisors, dtype=np.int64)
+  if np.any(divisors == 0):
+    raise ZeroDivisionError('division by zero')
+  dividends, divisors = np.broadcast_arrays(dividends, divisors)
+  negative = (dividends < 0) ^ (divisors < 0)
+  # uint64 keeps abs(-2**63) exact
+  remainder = np.abs(dividends).astype(np.uint64)
+  divisor = np.abs(divisors).astype(np.uint64)
+  quotient = np.zeros(remainder.shape, dtype=np.uint64)
+  for i in range(63, -1, -1):
+    shift = np.uint64(i)
+    # divisor << i must not overflow, so compare remainder >> i instead
+    fits = (remainder >> shift) >= divisor
+    remainder = np.where(fits, remainder - (divisor << shift), remainder)
+    quotient |= fits.astype(np.uint64) << shift
+  quotient = quotient.astype(np.int64)
+  remainder = remainder.astype(np.int64)
+  return np.where(negative, -quotient, quotient), np.where(dividends < 0, -remainder, remainder)
+
+
+def benchmark(size=100000, repeat=3):
+  import random
+  pairs = [(random.getrandbits(62) - (1 << 61), random.getrandbits(20) + 1) for i in range(size)]
+  big = [(random.getrandbits(4096), random.getrandbits(2000) + 1) for i in range(size // 100)]
+  timings = [
+    ('dividemod 62 bit', lambda: [dividemod(a, b) for a, b in pairs]),
+    ('divmod 62 bit', lambda: [divmod(a, b) for a, b in pairs]),
+    ('dividemod 4096 bit', lambda: [dividemod(a, b) for a, b in big]),
+    ('divmod 4096 bit', lambda: [divmod(a, b) for a, b in big]),
+  ]
+  if np is not None:
+    a = np.array([p[0] for p in pairs], dtype=np.int64)
+    b = np.array([p[1] for p in pairs], dtype=np.int64)
+    timings.append(('dividebatch numpy', lambda: dividebatch(a, b)))
+    timings.append(('numpy divmod', lambda: np.divmod(a, b)))
+  for name, run in timings:
+    print(name.ljust(20), round(min(timeit.repeat(run, number=1, repeat=repeat)), 4), 's')
+
+
+if __name__ == "__main__":
+  if len(sys.argv) > 1 and sys.argv[1] == '--bench':
+    benchmark()
+  else:
+    a = int(input("Enter a for a/b: "))
+    b = int(input("Enter b for a/b: "))
+    print("Result of", a, "/", b, "is", divide(a, b))
@@ -1,3 +1,11 @@
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def equilibriumpoint(arr):
     leftsidesum=0
     rightsidesum=0
@@ -11,9 +19,75 @@ def equilibriumpoint(arr):
             leftsidesum+=arr[j]
         for j in range(i+1,n):
             rightsidesum+=arr[j]
-        
+
         if leftsidesum == rightsidesum:
             return i
     return -1
-arr=[-4,6,2,0,0,1,1]
-print('element :',arr[equilibriumpoint(arr)])
\ No newline at end of file
+
+
+class PrefixSum:
+    # prefix[i] is the sum of the first i values, built once in O(n)
+
+    def __init__(self, values, weights=None):
+        if weights is not None:
+            if len(weights) != len(values):
+                raise ValueError('need one weight per value')
+            if np is not None and isinstance(values, np.ndarray):
+                values = values * np.asarray(weights)
+            else:
+                values = [v * w for v, w in zip(values, weights)]
+        if np is not None and isinstance(values, np.ndarray):
+            # a plain [0] would turn unsigned sums into float64, so the zero
+            # takes the sums' dtype. uint64 may not fit int64, it stays exact
+            # as python ints
+            if values.dtype.kind in 'bi' or values.dtype.kind == 'u' and values.dtype.itemsize < 8:
+                sums = np.cumsum(values, dtype=np.int64)
+            elif values.dtype.kind == 'u':
+                sums = np.cumsum(values.astype(object))
+            else:
+                sums = np.cumsum(values)
+            self.prefix = np.concatenate((np.zeros(1, dtype=sums.dtype), sums))
+        else:
+            self.prefix = list(accumulate(values, initial=0))
+        self.total = self.prefix[-1]
+
+    def __len__(self):
+        return len(self.prefix) - 1
+
+    def rangesum(self, start, end):
+        # sum of values[start:end] in O(1)
+        return self.prefix[end] - self.prefix[start]
+
+    def leftsum(self, i):
+        return self.prefix[i]
+
+    def rightsum(self, i):
+        return self.total - self.prefix[i + 1]
+
+    def equilibriums(self, tolerance=0):
+        # every index whose left and right sums differ by at most tolerance
+        prefix = self.prefix
+        if np is not None and isinstance(prefix, np.ndarray):
+            difference = np.abs(prefix[:-1] - (self.total - prefix[1:]))
+            return np.nonzero(difference <= tolerance)[0].tolist()
+        total = self.total
+        return [i for i in range(len(prefix) - 1)
+                if abs(prefix[i] - (total - prefix[i + 1])) <= tolerance]
+
+    def firstequilibrium(self, tolerance=0):
+        # same answer as equilibriumpoint, -1 when there is none
+        total = self.total
+        for i in range(len(self.prefix) - 1):
+            if abs(self.prefix[i] - (total - self.prefix[i + 1])) <= tolerance:
+                return i
+        return -1
+
+
+if __name__ == "__main__":
+    arr=[-4,6,2,0,0,1,1]
+    point = equilibriumpoint(arr)
+    if point == -1:
+        print('no equilibrium point')
+    else:
+        print('element :',arr[point])
+    print('all equilibrium points :', PrefixSum(arr).equilibriums())
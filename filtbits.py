@@ -1,3 +1,13 @@
+from itertools import combinations
+
+from numberofbits import POPCOUNT_TABLE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def totalflips(number1,number2):
     flips =0
     while (number1 > 0 or number2 > 0):
@@ -7,13 +17,100 @@ def totalflips(number1,number2):
             flips+=1
 
         number1>>=1
-        number2>>=2
+        number2>>=1
 
     return flips
 
-number1=int(input('enter first number'))
-number2=int(input('enter secound number'))
 
-print('number of flips neded is ',totalflips(number1,number2))
+def popcount64(values):
+    # popcount of every element of a uint64 numpy array through a byte table
+    table = np.frombuffer(POPCOUNT_TABLE, dtype=np.uint8)
+    rows = np.ascontiguousarray(values, dtype=np.uint64).view(np.uint8)
+    rows = rows.reshape(values.shape + (8,))
+    return table[rows].sum(axis=-1, dtype=np.int64)
+
+
+def bulkflips(codes1, codes2):
+    # flips between codes1[i] and codes2[i] for every i
+    if len(codes1) != len(codes2):
+        raise ValueError('both code lists must have the same length')
+    if np is not None and isinstance(codes1, np.ndarray):
+        return popcount64(np.bitwise_xor(codes1.astype(np.uint64), np.asarray(codes2, dtype=np.uint64)))
+    return [(a ^ b).bit_count() for a, b in zip(codes1, codes2)]
+
+
+def pairwiseflips(codes1, codes2):
+    # matrix of flips between every code of codes1 and every code of codes2
+    if np is not None and isinstance(codes1, np.ndarray):
+        left = codes1.astype(np.uint64)[:, None]
+        right = np.asarray(codes2, dtype=np.uint64)[None, :]
+        return popcount64(np.bitwise_xor(left, right))
+    return [[(a ^ b).bit_count() for b in codes2] for a in codes1]
+
+
+class MultiIndexHash:
+    # splits every code into `parts` substrings and keeps one hash table per
+    # substring. if two codes differ in at most d bits then at least one of
+    # their substrings differs in at most d // parts bits, so only the codes
+    # sharing a nearby substring have to be checked.
+
+    def __init__(self, codes, bits=64, parts=4):
+        if bits % parts:
+            raise ValueError('bits must be divisible by parts')
+        self.bits = bits
+        self.parts = parts
+        self.width = bits // parts
+        self.mask = (1 << self.width) - 1
+        self.codes = [int(c) for c in codes]
+        self.tables = [{} for i in range(parts)]
+        for index, code in enumerate(self.codes):
+            for part, key in enumerate(self.split(code)):
+                self.tables[part].setdefault(key, []).append(index)
+
+    def split(self, code):
+        return [(code >> (part * self.width)) & self.mask for part in range(self.parts)]
+
+    def neighbours(self, key, radius):
+        # every substring value within `radius` flips of key
+        for r in range(radius + 1):
+            for positions in combinations(range(self.width), r):
+                flipped = key
+                for p in positions:
+                    flipped ^= 1 << p
+                yield flipped
+
+    def candidates(self, code, distance):
+        radius = distance // self.parts
+        found = set()
+        for part, key in enumerate(self.split(code)):
+            table = self.tables[part]
+            for near in self.neighbours(key, radius):
+                found.update(table.get(near, ()))
+        return found
+
+    def search(self, code, k=1, distance=None):
+        # the k nearest (index, flips) pairs within `distance`, closest first
+        if distance is None:
+            distance = self.bits
+        code = int(code)
+        if distance // self.parts >= self.width:
+            pool = range(len(self.codes))
+        else:
+            pool = self.candidates(code, distance)
+        matches = []
+        for index in pool:
+            flips = (self.codes[index] ^ code).bit_count()
+            if flips <= distance:
+                matches.append((flips, index))
+        matches.sort()
+        return [(index, flips) for flips, index in matches[:k]]
+
+    def searchmany(self, codes, k=1, distance=None):
+        return [self.search(code, k, distance) for code in codes]
+
 
+if __name__ == "__main__":
+    number1=int(input('enter first number'))
+    number2=int(input('enter secound number'))
 
+    print('number of flips neded is ',totalflips(number1,number2))
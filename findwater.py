@@ -1,3 +1,11 @@
+import heapq
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def findwater(a, a_size):
     lefttallest=[0]*a_size
     righttallest=[0]*a_size
@@ -5,13 +13,96 @@ def findwater(a, a_size):
     lefttallest[0]=a[0]
     for i in range(1,a_size):
         lefttallest[i]=max(lefttallest[i-1],a[i])
-    righttallest[0]=a[0]
-    for i in range(1,a_size):
+    righttallest[a_size-1]=a[a_size-1]
+    for i in range(a_size-2,-1,-1):
         righttallest[i]=max(righttallest[i+1],a[i])
     for i in range(0, a_size):
-        water+= min(lefttallest[i],righttallest[i] - a[i])
+        water+= min(lefttallest[i],righttallest[i]) - a[i]
+    return water
+
+
+def trapwater(a):
+    # two pointers: the lower side's tallest bar decides the water level
+    # there, so no auxiliary arrays are needed
+    if np is not None and isinstance(a, np.ndarray):
+        # plain ints, numpy scalars would add up in the array's small dtype
+        a = a.tolist()
+    left = 0
+    right = len(a) - 1
+    leftmax = rightmax = 0
+    water = 0
+    while left < right:
+        if a[left] < a[right]:
+            if a[left] >= leftmax:
+                leftmax = a[left]
+            else:
+                water += leftmax - a[left]
+            left += 1
+        else:
+            if a[right] >= rightmax:
+                rightmax = a[right]
+            else:
+                water += rightmax - a[right]
+            right -= 1
     return water
-a= [0,1,0,2,1,1,0,1,3,2,1,2,1]
-bars= len(a)
-print('water :',findwater(a,bars))
 
+
+def trapwaterarray(a):
+    # numpy version of findwater with running maxima from both sides
+    a = np.asarray(a)
+    if not len(a):
+        return 0
+    left = np.maximum.accumulate(a)
+    right = np.maximum.accumulate(a[::-1])[::-1]
+    water = np.minimum(left, right) - a
+    if a.dtype.kind in 'iub':
+        return int(water.sum(dtype=np.int64))
+    return float(water.sum())
+
+
+def trapwater2d(grid):
+    # water held by a 2-d elevation map. the border can not hold water, so
+    # cells are flooded inwards from the lowest wall in a heap, every cell
+    # fills up to the level of the lowest wall it was reached through
+    if np is not None and isinstance(grid, np.ndarray):
+        # plain ints do not overflow like uint16 rasters and index faster
+        grid = grid.tolist()
+    rows = len(grid)
+    columns = len(grid[0]) if rows else 0
+    if rows < 3 or columns < 3:
+        return 0
+    visited = bytearray(rows * columns)
+    heap = []
+    for r in range(rows):
+        for c in (0, columns - 1):
+            heap.append((grid[r][c], r * columns + c))
+            visited[r * columns + c] = 1
+    for c in range(1, columns - 1):
+        for r in (0, rows - 1):
+            heap.append((grid[r][c], r * columns + c))
+            visited[r * columns + c] = 1
+    heapq.heapify(heap)
+
+    water = 0
+    while heap:
+        level, cell = heapq.heappop(heap)
+        r, c = divmod(cell, columns)
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < rows and 0 <= nc < columns:
+                neighbour = nr * columns + nc
+                if visited[neighbour]:
+                    continue
+                visited[neighbour] = 1
+                height = grid[nr][nc]
+                if height < level:
+                    water += level - height
+                    heapq.heappush(heap, (level, neighbour))
+                else:
+                    heapq.heappush(heap, (height, neighbour))
+    return water
+
+
+if __name__ == "__main__":
+    a= [0,1,0,2,1,1,0,1,3,2,1,2,1]
+    bars= len(a)
+    print('water :',findwater(a,bars))
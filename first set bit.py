@@ -1,12 +1,12 @@
 def firstsetbit(number):
-    postion=1
-    mask=1
-    while (not(number&mask)):
-        mask=mask<<1
-        postion+= 1 
+    # position counted from 1, 0 when no bit is set. number & -number keeps
+    # only the lowest set bit so there is nothing to loop over
+    if number == 0:
+        return 0
+    return (number & -number).bit_length()
 
 
-    return postion
-number= int(input('enter number'))
+if __name__ == "__main__":
+    number= int(input('enter number'))
 
-print('postions of the first set bit ',firstsetbit(number))
\ No newline at end of file
+    print('postions of the first set bit ',firstsetbit(number))
@@ -1,14 +1,88 @@
+import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def reversebits(number):
     reversed=0
 
     while (number>0):
         reversed=reversed<<1
-        
+
         if (number&1==1):
             reversed=reversed^1
 
         number = number>>1
 
     return reversed
-number=int(input('enter your number'))
-print('number with reversed bits',reversebits(number))
\ No newline at end of file
+
+
+# every byte value with its 8 bits mirrored
+REVERSE_TABLE = bytes(int('{:08b}'.format(i)[::-1], 2) for i in range(256))
+
+TYPECODES = {8: 'B', 16: 'H', 32: 'I', 64: 'Q'}
+
+
+def reversewidth(number, width=32):
+    # reverse all `width` bits of number, leading zeros included
+    if width not in TYPECODES:
+        raise ValueError('width must be 8, 16, 32 or 64')
+    nbytes = width // 8
+    data = (number & ((1 << width) - 1)).to_bytes(nbytes, 'little')
+    return int.from_bytes(data.translate(REVERSE_TABLE), 'big')
+
+
+def reversebulk(words, width=32):
+    # reverse every word of a list, array.array, numpy array or raw buffer.
+    # mirroring a word is mirroring each byte and then the byte order, so a
+    # whole buffer is one translate plus one byteswap
+    if width not in TYPECODES:
+        raise ValueError('width must be 8, 16, 32 or 64')
+    if np is not None and isinstance(words, np.ndarray):
+        dtype = np.dtype('uint' + str(width))
+        values = np.ascontiguousarray(words, dtype=dtype)
+        table = np.frombuffer(REVERSE_TABLE, dtype=np.uint8)
+        flipped = table[values.view(np.uint8)].view(dtype)
+        return flipped.byteswap()
+    if isinstance(words, (bytes, bytearray, memoryview)):
+        result = array.array(TYPECODES[width])
+        result.frombytes(bytes(words).translate(REVERSE_TABLE))
+    else:
+        if not isinstance(words, array.array) or words.typecode != TYPECODES[width]:
+            words = array.array(TYPECODES[width], words)
+        result = array.array(TYPECODES[width])
+        result.frombytes(words.tobytes().translate(REVERSE_TABLE))
+    if result.itemsize > 1:
+        result.byteswap()
+    return result
+
+
+def bitreversalpermutation(k):
+    # yields rev(0), rev(1) ... rev(2^k - 1) on k bits, the order fft
+    # butterflies read their input in. built from the previous value so each
+    # step is O(1) amortised
+    n = 1 << k
+    reversed = 0
+    for i in range(n):
+        yield reversed
+        bit = n >> 1
+        while bit and reversed & bit:
+            reversed ^= bit
+            bit >>= 1
+        reversed |= bit
+
+
+def bitreversalorder(values):
+    # values reordered by the bit reversal permutation, length must be 2^k
+    n = len(values)
+    if n & (n - 1):
+        raise ValueError('length must be a power of 2')
+    return [values[i] for i in bitreversalpermutation(n.bit_length() - 1)]
+
+
+if __name__ == "__main__":
+    number=int(input('enter your number'))
+    print('number with reversed bits',reversebits(number))
@@ -25,5 +25,115 @@ def maxcricularsum(a):
     else:
         return max_kadane
 
-a=[11,10,-20,5,-3,-5,8,-13,10]
-print('maximum circular sum is',maxcricularsum(a))
+
+def maxcircular(a):
+    # best circular subarray as (sum, start, end) in one pass without
+    # touching a. end < start means the subarray wraps around the end.
+    # the wrapped answer is the total minus the smallest subarray
+    if not len(a):
+        raise ValueError('array is empty')
+    total = 0
+    best = bestsum = lowest = lowsum = None
+    beststart = lowstart = 0
+    for i, value in enumerate(a):
+        total += value
+        if bestsum is None or bestsum < 0:
+            bestsum, beststart = value, i
+        else:
+            bestsum += value
+        if best is None or bestsum > best[0]:
+            best = (bestsum, beststart, i)
+        if lowsum is None or lowsum > 0:
+            lowsum, lowstart = value, i
+        else:
+            lowsum += value
+        if lowest is None or lowsum < lowest[0]:
+            lowest = (lowsum, lowstart, i)
+    n = len(a)
+    # leaving out the smallest subarray only makes sense if something is left
+    if best[0] >= 0 and lowest[2] - lowest[1] + 1 < n and total - lowest[0] > best[0]:
+        return total - lowest[0], (lowest[2] + 1) % n, (lowest[1] - 1) % n
+    return best
+
+
+class SegmentTree:
+    # every node keeps (total, best prefix, best suffix, best) for its range,
+    # and the same for the smallest sums so circular queries work too. a
+    # point update rebuilds log n nodes
+
+    def __init__(self, values):
+        self.n = len(values)
+        size = 1
+        while size < max(self.n, 1):
+            size <<= 1
+        self.size = size
+        self.nodes = [None] * (2 * size)
+        for i, value in enumerate(values):
+            self.nodes[size + i] = self.leaf(value)
+        for i in range(size - 1, 0, -1):
+            self.nodes[i] = self.merge(self.nodes[2 * i], self.nodes[2 * i + 1])
+
+    @staticmethod
+    def leaf(value):
+        return (value, value, value, value, value, value, value)
+
+    @staticmethod
+    def merge(left, right):
+        if left is None:
+            return right
+        if right is None:
+            return left
+        ltotal, lpre, lsuf, lbest, lminpre, lminsuf, lminbest = left
+        rtotal, rpre, rsuf, rbest, rminpre, rminsuf, rminbest = right
+        return (ltotal + rtotal,
+                max(lpre, ltotal + rpre),
+                max(rsuf, rtotal + lsuf),
+                max(lbest, rbest, lsuf + rpre),
+                min(lminpre, ltotal + rminpre),
+                min(rminsuf, rtotal + lminsuf),
+                min(lminbest, rminbest, lminsuf + rminpre))
+
+    def update(self, i, value):
+        if not 0 <= i < self.n:
+            raise IndexError('index out of range')
+        i += self.size
+        self.nodes[i] = self.leaf(value)
+        i >>= 1
+        while i:
+            self.nodes[i] = self.merge(self.nodes[2 * i], self.nodes[2 * i + 1])
+            i >>= 1
+
+    def node(self, start, end):
+        # merged node for a[start:end]
+        if not 0 <= start < end <= self.n:
+            raise IndexError('empty or out of range query')
+        left = right = None
+        start += self.size
+        end += self.size
+        while start < end:
+            if start & 1:
+                left = self.merge(left, self.nodes[start])
+                start += 1
+            if end & 1:
+                end -= 1
+                right = self.merge(self.nodes[end], right)
+            start >>= 1
+            end >>= 1
+        return self.merge(left, right)
+
+    def maxsubarray(self, start=0, end=None):
+        # best subarray sum inside a[start:end]
+        return self.node(start, self.n if end is None else end)[3]
+
+    def maxcircular(self, start=0, end=None):
+        # best subarray sum of a[start:end] treated as a ring
+        total, pre, suf, best, minpre, minsuf, minbest = self.node(start, self.n if end is None else end)
+        if best < 0:
+            return best
+        return max(best, total - minbest)
+
+
+if __name__ == "__main__":
+    a=[11,10,-20,5,-3,-5,8,-13,10]
+    print('maximum circular sum is',maxcricularsum(list(a)))
+    print('maximum circular subarray (sum, start, end) is',maxcircular(a))
@@ -1,11 +1,93 @@
+import operator
+import re
+
 def max1(number):
 
 	count = 0
 
 	while (number!=0):
-	
+
 		number = (number & (number << 1))
 
 		count=count+1
-	
+
 	return count
+
+
+# bits are read most significant first inside every byte, so the stream
+# 0b11000000 0b00000011 starts and ends with a run of two ones
+def byteruns(value):
+	bits = format(value, '08b')
+	return len(bits) - len(bits.lstrip('1')), len(bits) - len(bits.rstrip('1')), max(map(len, bits.split('0')))
+
+PREFIX_TABLE = bytes(byteruns(i)[0] for i in range(256))
+SUFFIX_TABLE = bytes(byteruns(i)[1] for i in range(256))
+INNER_TABLE = bytes(byteruns(i)[2] for i in range(256))
+FULL_BYTES = re.compile(rb'\xff+')
+
+
+class RunCounter:
+	# longest run of ones over chunks fed in order, keeping only the run
+	# still open at the end of the last chunk
+
+	def __init__(self):
+		self.best = 0
+		self.carry = 0
+
+	def feed(self, chunk):
+		chunk = bytes(chunk)
+		size = len(chunk)
+		if not size:
+			return
+		first = len(chunk) - len(chunk.lstrip(b'\xff'))
+		if first == size:
+			self.carry += 8 * size
+			self.best = max(self.best, self.carry)
+			return
+		last = len(chunk.rstrip(b'\xff')) - 1
+		prefix = chunk.translate(PREFIX_TABLE)
+		suffix = chunk.translate(SUFFIX_TABLE)
+
+		best = max(self.best, self.carry + 8 * first + prefix[first], max(chunk.translate(INNER_TABLE)))
+		if last > first:
+			# runs across two neighbouring bytes
+			best = max(best, max(map(operator.add, suffix[first:last], prefix[first + 1:last + 1])))
+			# runs across a stretch of full bytes
+			for match in FULL_BYTES.finditer(chunk, first, last):
+				start, end = match.span()
+				best = max(best, suffix[start - 1] + 8 * (end - start) + prefix[end])
+		self.carry = 8 * (size - 1 - last) + suffix[last]
+		self.best = max(best, self.carry)
+
+	def result(self):
+		return self.best
+
+
+def longestrun(chunks):
+	counter = RunCounter()
+	for chunk in chunks:
+		counter.feed(chunk)
+	return counter.result()
+
+
+def readchunks(path, chunksize=1 << 20):
+	# reuses one buffer so memory stays the same whatever the file size
+	buffer = bytearray(chunksize)
+	view = memoryview(buffer)
+	with open(path, 'rb') as file:
+		while True:
+			count = file.readinto(buffer)
+			if not count:
+				break
+			yield view[:count]
+
+
+def longestrunfile(path, chunksize=1 << 20):
+	return longestrun(readchunks(path, chunksize))
+
+
+def max1fast(number):
+	# same answer as max1 without the repeated big int shifts
+	if number <= 0:
+		return 0
+	return longestrun([number.to_bytes((number.bit_length() + 7) // 8, 'big')])
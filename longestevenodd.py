@@ -1,4 +1,14 @@
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def longestEvenOddSubarray(arr, n):
+    if n == 0:
+        return 0
     longest = 1
     cnt = 1
 
@@ -9,14 +19,71 @@ def longestEvenOddSubarray(arr, n):
             longest = max(longest, cnt)
             cnt = 1
 
-    if longest == 1:
-        return 0
-
     return max(cnt, longest)
 
 
-# Driver code
-arr = [3, 2, 4, 3, 2, 3, 3, 3, 2, 3, 2, 3, 2, 4, 2]
-n = len(arr)
+# a run keeps going while predicate(a[i], a[i + 1]) holds. every predicate
+# only uses operators, so it works on two numbers and on two numpy arrays
+PREDICATES = {
+    'alternating': lambda a, b: (a % 2) != (b % 2),
+    'equal': lambda a, b: a == b,
+    'signchange': lambda a, b: ((a < 0) & (b > 0)) | ((a > 0) & (b < 0)),
+}
+
+
+def runbounds(arr, predicate='alternating'):
+    # (starts, lengths) of every maximal run, one pass over neighbour pairs
+    if isinstance(predicate, str):
+        predicate = PREDICATES[predicate]
+    n = len(arr)
+    if np is not None and isinstance(arr, np.ndarray):
+        if n == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        links = np.asarray(predicate(arr[:-1], arr[1:]), dtype=bool)
+        starts = np.concatenate(([0], np.flatnonzero(~links) + 1))
+        lengths = np.diff(np.append(starts, n))
+        return starts, lengths
+    starts = [0] if n else []
+    for i, linked in enumerate(map(predicate, arr[:-1], arr[1:]), 1):
+        if not linked:
+            starts.append(i)
+    lengths = [end - start for start, end in zip(starts, starts[1:] + [n])]
+    return starts, lengths
+
+
+def longestrun(arr, predicate='alternating'):
+    # (start, length) of the first longest run, (0, 0) for an empty array
+    starts, lengths = runbounds(arr, predicate)
+    if not len(lengths):
+        return 0, 0
+    if np is not None and isinstance(lengths, np.ndarray):
+        best = int(np.argmax(lengths))
+    else:
+        best = lengths.index(max(lengths))
+    return int(starts[best]), int(lengths[best])
+
+
+def runsabove(arr, threshold, predicate='alternating'):
+    # (start, length) of every run at least threshold long
+    starts, lengths = runbounds(arr, predicate)
+    if np is not None and isinstance(lengths, np.ndarray):
+        keep = lengths >= threshold
+        return list(zip(starts[keep].tolist(), lengths[keep].tolist()))
+    return [(s, l) for s, l in zip(starts, lengths) if l >= threshold]
+
+
+def runhistogram(arr, predicate='alternating'):
+    # run length -> number of runs that long
+    starts, lengths = runbounds(arr, predicate)
+    if np is not None and isinstance(lengths, np.ndarray):
+        counts = np.bincount(lengths)
+        return {length: int(counts[length]) for length in np.flatnonzero(counts).tolist()}
+    return dict(Counter(lengths))
+
+
+if __name__ == "__main__":
+    # Driver code
+    arr = [3, 2, 4, 3, 2, 3, 3, 3, 2, 3, 2, 3, 2, 4, 2]
+    n = len(arr)
 
-print(longestEvenOddSubarray(arr, n))
\ No newline at end of file
+    print(longestEvenOddSubarray(arr, n))
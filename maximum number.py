@@ -1,3 +1,7 @@
+import re
+from collections import deque
+
+
 def getmaxlenght(a,a_size):
 
     conter = 0
@@ -6,13 +10,86 @@ def getmaxlenght(a,a_size):
     for i in range(0, a_size):
         if (a[i]==0):
             conter = 0
-        
+
 
         else:
             conter += 1
             maxones = max(maxones,conter)
-        return maxones
-a=[1,1,0,0,1,0,1,0,1,1,1,1]
-a_size=len(a)
+    return maxones
+
+
+# bit offsets of the zeros in every byte value, most significant bit first
+ZERO_OFFSETS = tuple(tuple(i for i in range(8) if not value >> (7 - i) & 1) for value in range(256))
+NOT_FULL = re.compile(rb'[^\xff]')
+
+
+class FlipWindow:
+    # longest stretch of ones with at most k zeros flipped. the best window
+    # always runs from just after one zero to just before another, so only
+    # the last k + 1 zero positions are kept whatever the input size
+
+    def __init__(self, k=0):
+        if k < 0:
+            raise ValueError('k must not be negative')
+        self.zeros = deque(maxlen=k + 1)
+        self.position = 0
+        self.best = (0, 0, -1)
+
+    def candidate(self, end):
+        start = self.zeros[0] + 1 if len(self.zeros) == self.zeros.maxlen else 0
+        if end - start + 1 > self.best[0]:
+            self.best = (end - start + 1, start, end)
+
+    def zero(self, position):
+        self.candidate(position - 1)
+        self.zeros.append(position)
+
+    def feed(self, values):
+        # a list or other iterable of 0/1 values
+        for value in values:
+            if not value:
+                self.zero(self.position)
+            self.position += 1
+
+    def feedbits(self, chunk):
+        # a bytes like bitmap chunk, 8 values per byte; bytes that are all ones
+        # are skipped over by the regex
+        for match in NOT_FULL.finditer(chunk):
+            index = match.start()
+            base = self.position + index * 8
+            for offset in ZERO_OFFSETS[chunk[index]]:
+                self.zero(base + offset)
+        self.position += len(chunk) * 8
+
+    def result(self):
+        # (length, start, end) with end included, (0, 0, -1) if nothing fits
+        self.candidate(self.position - 1)
+        return self.best
+
+
+def maxoneswithflips(a, k=0):
+    window = FlipWindow(k)
+    if isinstance(a, (bytes, bytearray, memoryview)):
+        window.feedbits(bytes(a))
+    else:
+        window.feed(a)
+    return window.result()
+
+
+def maxoneswithflipsfile(path, k=0, chunksize=1 << 20):
+    # the same over a bitmap file read a chunk at a time
+    window = FlipWindow(k)
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(chunksize)
+            if not chunk:
+                break
+            window.feedbits(chunk)
+    return window.result()
+
+
+if __name__ == "__main__":
+    a=[1,1,0,0,1,0,1,0,1,1,1,1]
+    a_size=len(a)
 
-print('maxs 1s is ',getmaxlenght(a,a_size))
\ No newline at end of file
+    print('maxs 1s is ',getmaxlenght(a,a_size))
@@ -1,13 +1,81 @@
+from collections import deque
+
+
 def maxsubarray(a,a_size):
-    max = -99999999999
+    max = None
     cmax =0
 
     for i in range (0,a_size):
         cmax=cmax+a[i]
-        if (max<cmax):
+        if (max is None or max<cmax):
             max=cmax
         if cmax<0:
             cmax=0
     return max
-a=[1,2,3,-4,5,-22,-4,25,2,-9]
-print(maxsubarray(a,len(a)))
+
+
+def streamkadane(samples):
+    # kadane over any iterable, yields (best, start, end) after every sample
+    # so the running answer is there without keeping the samples
+    best = None
+    current = 0
+    currentstart = 0
+    for i, value in enumerate(samples):
+        if i == 0 or current < 0:
+            current, currentstart = value, i
+        else:
+            current += value
+        if best is None or current > best[0]:
+            best = (current, currentstart, i)
+        yield best
+
+
+def readsamples(path, chunksize=1 << 20, kind=float):
+    # whitespace separated numbers from a text file, read a chunk at a time
+    left = ''
+    with open(path) as file:
+        while True:
+            chunk = file.read(chunksize)
+            if not chunk:
+                break
+            chunk = left + chunk
+            tokens = chunk.split()
+            left = tokens.pop() if tokens and not chunk[-1].isspace() else ''
+            for token in tokens:
+                yield kind(token)
+    if left:
+        yield kind(left)
+
+
+def slidingwindowmax(samples, window):
+    # for every sample the best subarray ending there that is at most window
+    # samples long, as (best, start, end). that is prefix[end + 1] minus the
+    # smallest prefix[start] of the last window prefixes, which a deque with
+    # increasing prefix sums gives in amortized O(1)
+    if window < 1:
+        raise ValueError('window must be at least 1')
+    prefixes = deque([(0, 0)])
+    prefix = 0
+    for i, value in enumerate(samples):
+        prefix += value
+        while prefixes[0][0] < i + 1 - window:
+            prefixes.popleft()
+        start, lowest = prefixes[0]
+        yield prefix - lowest, start, i
+        while prefixes and prefixes[-1][1] >= prefix:
+            prefixes.pop()
+        prefixes.append((i + 1, prefix))
+
+
+def windowbest(samples, window):
+    # best subarray of at most window samples over the whole stream
+    best = None
+    for result in slidingwindowmax(samples, window):
+        if best is None or result[0] > best[0]:
+            best = result
+    return best
+
+
+if __name__ == "__main__":
+    a=[1,2,3,-4,5,-22,-4,25,2,-9]
+    print(maxsubarray(a,len(a)))
@@ -1,10 +1,121 @@
-a=[0,1,1,0,0,0,0,1]
-zeroflip =0
-oneflip = 0
-for i in range(len(a)):
-    if a[i]==0:
-        zeroflip +=1
-    if a[i]==1:
-
-        oneflip+=1 
-print('It will take',zeroflip,"flips to change all valvues to one \n it will",oneflip,"flip to change all valcues to zero")
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# the values alternate between runs, so the value the array does not start
+# with never has more runs than the other one. flipping each of its runs is
+# the smallest number of group flips, and it is known from the first value
+
+# offsets inside a byte (most significant bit first) where the bit differs
+# from the one before it, for both values the previous byte could end with
+TRANSITIONS = tuple(
+    tuple(tuple(i for i in range(8) if (value >> (7 - i) & 1) != (previous if i == 0 else value >> (8 - i) & 1))
+          for value in range(256))
+    for previous in (0, 1))
+NOT_FULL = (re.compile(rb'[^\x00]'), re.compile(rb'[^\xff]'))
+
+
+class FlipPlanner:
+    # ranges (start, end) with end included of the runs to flip, in one pass
+    # over values or bitmap chunks
+
+    def __init__(self):
+        self.position = 0
+        self.current = None
+        self.runstart = 0
+        self.target = None
+        self.ranges = []
+
+    def start(self, value):
+        self.current = value
+        self.target = 1 - value
+
+    def switch(self, position):
+        if self.current == self.target:
+            self.ranges.append((self.runstart, position - 1))
+        self.current = 1 - self.current
+        self.runstart = position
+
+    def feed(self, values):
+        for value in values:
+            value = 1 if value else 0
+            if self.current is None:
+                self.start(value)
+            elif value != self.current:
+                self.switch(self.position)
+            self.position += 1
+
+    def feedbits(self, chunk):
+        if not chunk:
+            return
+        if self.current is None:
+            self.start(chunk[0] >> 7)
+        base = self.position
+        index = 0
+        # bytes that only continue the current run are skipped by the regex
+        while True:
+            match = NOT_FULL[self.current].search(chunk, index)
+            if match is None:
+                break
+            index = match.start()
+            value = chunk[index]
+            for offset in TRANSITIONS[self.current][value]:
+                self.switch(base + index * 8 + offset)
+            index += 1
+        self.position = base + len(chunk) * 8
+
+    def result(self):
+        # (flips, value to flip, ranges)
+        ranges = list(self.ranges)
+        if self.current == self.target and self.position:
+            ranges.append((self.runstart, self.position - 1))
+        return len(ranges), self.target, ranges
+
+
+def flipplan(a):
+    # (flips, value to flip, ranges) for a list or numpy array of 0/1 values
+    if np is not None and isinstance(a, np.ndarray):
+        n = len(a)
+        if n == 0:
+            return 0, None, []
+        values = a != 0
+        changes = np.flatnonzero(values[1:] != values[:-1]) + 1
+        starts = np.concatenate(([0], changes))
+        ends = np.concatenate((changes - 1, [n - 1]))
+        target = 0 if values[0] else 1
+        # runs alternate, so the target runs are every second one from 1
+        return len(starts[1::2]), target, list(zip(starts[1::2].tolist(), ends[1::2].tolist()))
+    planner = FlipPlanner()
+    planner.feed(a)
+    return planner.result()
+
+
+def flipplanfile(path, chunksize=1 << 20):
+    # the same over a bitmap file, 8 values per byte
+    planner = FlipPlanner()
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(chunksize)
+            if not chunk:
+                break
+            planner.feedbits(chunk)
+    return planner.result()
+
+
+if __name__ == "__main__":
+    a=[0,1,1,0,0,0,0,1]
+    zeroflip =0
+    oneflip = 0
+    for i in range(len(a)):
+        if a[i]==0:
+            zeroflip +=1
+        if a[i]==1:
+
+            oneflip+=1
+    print('It will take',zeroflip,"flips to change all valvues to one \n it will",oneflip,"flip to change all valcues to zero")
+    flips, value, ranges = flipplan(a)
+    print('with group flips it takes', flips, 'flips of', value, 'at', ranges)
@@ -1,3 +1,13 @@
+import array
+import sys
+import timeit
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def numberofbits(n):
     count=0
     while(n):
@@ -5,5 +15,90 @@ def numberofbits(n):
         n>>=1
     return count
 
-number=int(input('enter your number :'))
-print('total bits:', numberofbits(number))
\ No newline at end of file
+
+# ones in every byte value, used to count whole buffers a byte at a time
+POPCOUNT_TABLE = bytes(bin(i).count('1') for i in range(256))
+BITLENGTH_TABLE = bytes(i.bit_length() for i in range(256))
+ZEROS_TABLE = bytes(i.bit_length() - bin(i).count('1') for i in range(256))
+
+
+def bitstats(numbers):
+    # bit length, ones and zeros (inside the bit length) for every number
+    # negative numbers are counted on their absolute value like int.bit_length
+    if isinstance(numbers, (bytes, bytearray, memoryview)):
+        return bufferstats(numbers)
+    if np is not None and isinstance(numbers, np.ndarray):
+        return numpystats(numbers)
+
+    bits = array.array('q', [n.bit_length() for n in numbers])
+    ones = array.array('q', [n.bit_count() for n in numbers])
+    zeros = array.array('q', [b - o for b, o in zip(bits, ones)])
+    return makestats(bits, ones, zeros)
+
+
+def bufferstats(buffer):
+    # every byte of a raw buffer is one element
+    data = bytes(memoryview(buffer).cast('B'))
+    bits = array.array('B', data.translate(BITLENGTH_TABLE))
+    ones = array.array('B', data.translate(POPCOUNT_TABLE))
+    zeros = array.array('B', data.translate(ZEROS_TABLE))
+    return makestats(bits, ones, zeros)
+
+
+def numpystats(values):
+    if values.dtype.kind not in 'iub':
+        raise TypeError('only integer arrays are supported, got ' + str(values.dtype))
+    values = np.ascontiguousarray(values.ravel())
+    if values.dtype.kind == 'i':
+        values = np.abs(values)
+    size = values.dtype.itemsize
+    # little endian bytes of every element, one row per element
+    rows = values.astype(values.dtype.newbyteorder('<')).view(np.uint8).reshape(-1, size)
+    table = np.frombuffer(POPCOUNT_TABLE, dtype=np.uint8)
+    ones = table[rows].sum(axis=1, dtype=np.int64)
+
+    nonzero = rows != 0
+    top = size - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+    topbyte = rows[np.arange(len(rows)), top]
+    bits = np.where(nonzero.any(axis=1),
+                    top * 8 + np.frombuffer(BITLENGTH_TABLE, dtype=np.uint8)[topbyte], 0)
+    bits = bits.astype(np.int64)
+    return makestats(bits, ones, bits - ones)
+
+
+def total(values):
+    return int(values.sum()) if hasattr(values, 'sum') else sum(values)
+
+
+def makestats(bits, ones, zeros):
+    return {
+        'bits': bits,
+        'ones': ones,
+        'zeros': zeros,
+        'total_bits': total(bits),
+        'total_ones': total(ones),
+        'total_zeros': total(zeros),
+        'count': len(bits),
+    }
+
+
+def benchmark(size=1000000, repeat=3):
+    # per bit loop against the batch api on the same random numbers
+    import random
+    numbers = [random.getrandbits(64) for i in range(size)]
+    loop = min(timeit.repeat(lambda: [numberofbits(n) for n in numbers], number=1, repeat=repeat))
+    batch = min(timeit.repeat(lambda: bitstats(numbers), number=1, repeat=repeat))
+    print('per bit loop :', round(loop, 3), 's')
+    print('bitstats list:', round(batch, 3), 's', ' speedup', round(loop / batch, 1), 'x')
+    if np is not None:
+        values = np.array(numbers, dtype=np.uint64)
+        fast = min(timeit.repeat(lambda: bitstats(values), number=1, repeat=repeat))
+        print('bitstats numpy:', round(fast, 3), 's', ' speedup', round(loop / fast, 1), 'x')
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--bench':
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1000000)
+    else:
+        number=int(input('enter your number :'))
+        print('total bits:', numberofbits(number))
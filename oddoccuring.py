@@ -1,3 +1,15 @@
+import os
+import sys
+from functools import reduce
+from multiprocessing import Pool
+from operator import xor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def oddoccuringnumber(arr):
     res=0
     for element in arr:
@@ -5,11 +17,161 @@ def oddoccuringnumber(arr):
 
     return res
 
-arr=[]
-n=int(input('enter array size:'))
-while(n):
-    num=int(input('enter number:'))
-    arr.append(num)
-    n-=1
 
-print('odd occuring number is:', oddoccuringnumber(arr))
+BLOCK_SIZE = 1 << 22
+
+
+def xorreduce(numbers):
+    if np is not None:
+        values = np.asarray(numbers, dtype=np.int64)
+        if not len(values):
+            return 0
+        return int(np.bitwise_xor.reduce(values))
+    return reduce(xor, numbers, 0)
+
+
+def signed(value):
+    # uint64 result back to the int64 value it came from
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def xorpartials(numbers):
+    # [xor of all, xor of the numbers with bit 0 set, ... with bit 63 set].
+    # the two odd numbers differ at the lowest set bit of the first entry,
+    # and the partial for that bit is one of them, so one pass is enough
+    if np is not None:
+        values = np.asarray(numbers, dtype=np.int64).view(np.uint64)
+        partials = [signed(int(np.bitwise_xor.reduce(values))) if len(values) else 0]
+        for bit in range(64):
+            chosen = values[(values >> np.uint64(bit)) & np.uint64(1) != 0]
+            partials.append(signed(int(np.bitwise_xor.reduce(chosen))) if len(chosen) else 0)
+        return partials
+    numbers = list(numbers)
+    partials = [reduce(xor, numbers, 0)]
+    for bit in range(64):
+        partials.append(reduce(xor, (n for n in numbers if n >> bit & 1), 0))
+    return partials
+
+
+def combine(left, right):
+    # partial results of either reducer xor together in any order
+    if isinstance(left, list):
+        return [a ^ b for a, b in zip(left, right)]
+    return left ^ right
+
+
+def twoodd(partials):
+    both = partials[0]
+    if both == 0:
+        raise ValueError('no two numbers occur an odd number of times')
+    bit = (both & -both).bit_length() - 1
+    x = partials[bit + 1]
+    return x, both ^ x
+
+
+def parsenumbers(tokens):
+    if np is not None:
+        return np.fromiter(map(int, tokens), dtype=np.int64, count=len(tokens))
+    return list(map(int, tokens))
+
+
+def readblocks(file, start=0, end=None, blocksize=BLOCK_SIZE):
+    # whitespace separated numbers from file[start:end], a block at a time.
+    # a number cut by the end of a block is kept for the next block. pipes
+    # can not seek, so only seek when a range is asked for
+    if start or end is not None:
+        file.seek(start)
+    left = b''
+    remaining = None if end is None else end - start
+    while remaining is None or remaining > 0:
+        size = blocksize if remaining is None else min(blocksize, remaining)
+        block = file.read(size)
+        if not block:
+            break
+        if remaining is not None:
+            remaining -= len(block)
+        block = left + block
+        tokens = block.split()
+        if tokens and not block[-1:].isspace():
+            left = tokens.pop()
+        else:
+            left = b''
+        yield parsenumbers(tokens)
+    if left:
+        yield parsenumbers([left])
+
+
+def streamxor(file, twoodd=False, blocksize=BLOCK_SIZE):
+    # single process reduction of a text stream such as stdin
+    reducer = xorpartials if twoodd else xorreduce
+    result = reducer([])
+    for numbers in readblocks(file, blocksize=blocksize):
+        result = combine(result, reducer(numbers))
+    return result
+
+
+def splitfile(path, parts):
+    # cut points near size/parts that never fall inside a number
+    size = os.path.getsize(path)
+    points = [0]
+    with open(path, 'rb') as file:
+        for i in range(1, parts):
+            point = max(size * i // parts, points[-1])
+            file.seek(point)
+            while point < size and not file.read(1).isspace():
+                point += 1
+            points.append(point)
+    points.append(size)
+    return [(a, b) for a, b in zip(points, points[1:]) if b > a]
+
+
+def xorrange(job):
+    path, start, end, twoodd = job
+    reducer = xorpartials if twoodd else xorreduce
+    result = reducer([])
+    with open(path, 'rb') as file:
+        for numbers in readblocks(file, start, end):
+            result = combine(result, reducer(numbers))
+    return result
+
+
+def parallelxor(path, twoodd=False, workers=None):
+    # every worker reduces its own byte range of the file, xor is associative
+    # so the partial results can be combined in any order
+    workers = workers or os.cpu_count() or 1
+    jobs = [(path, start, end, twoodd) for start, end in splitfile(path, workers * 4)]
+    empty = xorpartials([]) if twoodd else 0
+    if workers == 1 or len(jobs) < 2:
+        return reduce(combine, map(xorrange, jobs), empty)
+    with Pool(workers) as pool:
+        return reduce(combine, pool.imap_unordered(xorrange, jobs), empty)
+
+
+def oddoccuringfile(path, workers=None):
+    return parallelxor(path, workers=workers)
+
+
+def twooddfile(path, workers=None):
+    return twoodd(parallelxor(path, True, workers))
+
+
+def twooddstream(file):
+    return twoodd(streamxor(file, True))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+        if path == '-':
+            print('odd occuring number is:', streamxor(sys.stdin.buffer))
+        else:
+            print('odd occuring number is:', oddoccuringfile(path))
+    else:
+        arr=[]
+        n=int(input('enter array size:'))
+        while(n):
+            num=int(input('enter number:'))
+            arr.append(num)
+            n-=1
+
+        print('odd occuring number is:', oddoccuringnumber(arr))
@@ -1,3 +1,9 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class pair_elements:
 
     def twosum(self,nums, target):
@@ -10,5 +16,94 @@ class pair_elements:
             lookup[num]=i
 
 
-value= int(input('Enter sum for which you wantto make this search :'))
-print('index1=%d, index2=%d'% pair_elements().twosum((10,20,30,40,50,60,70),value))
\ No newline at end of file
+class PairIndex:
+    # nums sorted once so any number of two-sum and k-sum targets can be
+    # asked without building a lookup per call. answers are original indexes
+
+    def __init__(self, nums):
+        self.nums = list(nums)
+        self.order = sorted(range(len(self.nums)), key=self.nums.__getitem__)
+        self.values = [self.nums[i] for i in self.order]
+        self.indices = {}
+        for i, num in enumerate(self.nums):
+            self.indices.setdefault(num, []).append(i)
+        self.array = np.array(self.values) if np is not None else None
+
+    def pair(self, left, right):
+        return tuple(sorted((self.order[left], self.order[right])))
+
+    def twosum(self, target):
+        # one pair (i, j) with nums[i] + nums[j] == target, or None
+        if self.array is not None:
+            return self.twosumarray(target)
+        return self.twopointer(target, 0, len(self.values) - 1)
+
+    def twosumarray(self, target):
+        # every complement looked up at once with searchsorted
+        values = self.array
+        n = len(values)
+        if n < 2:
+            return None
+        complements = target - values
+        positions = np.searchsorted(values, complements)
+        # the element itself may be its own complement, then try the next one
+        positions = np.where(positions == np.arange(n), positions + 1, positions)
+        inside = positions < n
+        found = np.zeros(n, dtype=bool)
+        found[inside] = values[positions[inside]] == complements[inside]
+        hits = np.flatnonzero(found)
+        if not len(hits):
+            return None
+        k = int(hits[0])
+        return self.pair(k, int(positions[k]))
+
+    def twopointer(self, target, left, right):
+        values = self.values
+        while left < right:
+            total = values[left] + values[right]
+            if total == target:
+                return self.pair(left, right)
+            if total < target:
+                left += 1
+            else:
+                right -= 1
+        return None
+
+    def twosummany(self, targets):
+        return [self.twosum(target) for target in targets]
+
+    def ksum(self, target, k):
+        # k distinct indexes adding up to target, fixing the smallest value
+        # one at a time and finishing with two pointers, O(n^(k-1))
+        if k < 1:
+            raise ValueError('k must be at least 1')
+        if k == 1:
+            found = self.indices.get(target)
+            return (found[0],) if found else None
+        result = self.search(target, k, 0)
+        return tuple(sorted(result)) if result else None
+
+    def search(self, target, k, start):
+        values = self.values
+        if k == 2:
+            found = self.twopointer(target, start, len(values) - 1)
+            return list(found) if found else None
+        for i in range(start, len(values) - k + 1):
+            if i > start and values[i] == values[i - 1]:
+                continue
+            rest = self.search(target - values[i], k - 1, i + 1)
+            if rest:
+                return [self.order[i]] + rest
+        return None
+
+    def threesum(self, target):
+        return self.ksum(target, 3)
+
+
+if __name__ == "__main__":
+    value= int(input('Enter sum for which you wantto make this search :'))
+    found = pair_elements().twosum((10,20,30,40,50,60,70),value)
+    if found is None:
+        print('no pair adds up to', value)
+    else:
+        print('index1=%d, index2=%d'% found)
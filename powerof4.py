@@ -1,19 +1,16 @@
+from powerofk import ispowerof
+
+
 def powerof4(number):
-    count =0
-    if number==(number&(~(number - 1))):
-     while (number>1):
-        number>>=1
-        count = count+1
-        if count%2 ==0:
-            print('4^', count //2)
-            return True
-        else:
-            return False
-        
+    if ispowerof(number, 4):
+        print('4^', (number.bit_length() - 1) // 2)
+        return True
+    return False
+
 
-number = int(input('enter your number'))
-if (powerof4(number)):
-    print(number,' is a power of 4')
-else:
-    print(number, ' is not power of 4 ')
-    
\ No newline at end of file
+if __name__ == "__main__":
+    number = int(input('enter your number'))
+    if (powerof4(number)):
+        print(number,' is a power of 4')
+    else:
+        print(number, ' is not power of 4 ')
@@ -1,14 +1,14 @@
-n=int(input('enter your number'))
+from powerofk import ispowerof
+
+
 def ceckforpower(n):
-    if(n>0):
-        return False
-    if(n==1):
-        return True
-    if(n%4==0):
-        return ceckforpower(n/4)
-        return False
-if(ceckforpower(n)):
-    print('power of 4')
-
-else:
-    print('not power of 4 ')
\ No newline at end of file
+    return ispowerof(n, 4)
+
+
+if __name__ == "__main__":
+    n=int(input('enter your number'))
+    if(ceckforpower(n)):
+        print('power of 4')
+
+    else:
+        print('not power of 4 ')
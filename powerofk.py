@@ -0,0 +1,71 @@
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# powers of every base already asked for, grown when a bigger number comes in
+POWER_TABLES = {}
+
+
+def checkbase(base):
+    if base < 2:
+        raise ValueError('base must be 2 or more')
+
+
+def exponentof2(base):
+    # j when base is 2^j, otherwise 0
+    if base & (base - 1):
+        return 0
+    return base.bit_length() - 1
+
+
+def positionmask(j, width=64):
+    # ones at bit 0, j, 2j ... the only places a power of 2^j can have its bit
+    mask = 0
+    for position in range(0, width, j):
+        mask |= 1 << position
+    return mask
+
+
+def powertable(base, upto):
+    table = POWER_TABLES.setdefault(base, [1])
+    while table[-1] < upto:
+        table.append(table[-1] * base)
+    return table
+
+
+def ispowerof2(number):
+    return number > 0 and number & (number - 1) == 0
+
+
+def ispowerof(number, base):
+    checkbase(base)
+    if number < 1:
+        return False
+    j = exponentof2(base)
+    if j:
+        return number & (number - 1) == 0 and (number.bit_length() - 1) % j == 0
+    table = powertable(base, number)
+    i = bisect_left(table, number)
+    return table[i] == number
+
+
+def classify(numbers, base):
+    # ispowerof for a whole list or numpy array in one call
+    checkbase(base)
+    if np is None or not isinstance(numbers, np.ndarray):
+        return [ispowerof(int(n), base) for n in numbers]
+    if numbers.dtype.kind not in 'iu':
+        raise TypeError('only integer arrays are supported, got ' + str(numbers.dtype))
+    positive = numbers > 0
+    values = numbers.astype(np.uint64)
+    j = exponentof2(base)
+    if j:
+        single = (values & (values - np.uint64(1))) == 0
+        onplace = (values & np.uint64(positionmask(j))) != 0
+        return positive & single & onplace
+    table = np.array([p for p in powertable(base, 2 ** 64) if p < 2 ** 64], dtype=np.uint64)
+    return positive & np.isin(values, table)
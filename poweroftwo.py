@@ -1,14 +1,14 @@
-n=int(input('enter your number'))
+from powerofk import ispowerof
+
+
 def ceckforpower(n):
-    if(n>0):
-        return False
-    if(n==1):
-        return True
-    if(n%2==0):
-        return ceckforpower(n/2)
-        return False
-if(ceckforpower(n)):
-    print('not power of 2')
-
-else:
-    print(' power of 2 ')
\ No newline at end of file
+    return ispowerof(n, 2)
+
+
+if __name__ == "__main__":
+    n=int(input('enter your number'))
+    if(ceckforpower(n)):
+        print(' power of 2 ')
+
+    else:
+        print('not power of 2')
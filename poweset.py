@@ -1,19 +1,179 @@
 import math;
+import os
+import sys
+from multiprocessing import Pool
+
 def printPowerSet (set,SetSize):
     PowerSetSize = (int) (math.pow(2, SetSize))
     outer = 0
     inner = 0
-    
+
     for outer in range (0,PowerSetSize):
         for inner in range(0,SetSize):
             if((outer & (1<<inner))> 0):
                 print(set[inner], end = "")
         print("")
 
-size=int(input('enter array size'))
-set=[]
-for i in range(0,size):
-    n = int(input('enter element'))
-    set.append(n)
 
-printPowerSet(set,len(set))
\ No newline at end of file
+def graycodesubsets(set, start=0, stop=None):
+    # subsets in gray code order from mask gray(start) up to gray(stop - 1).
+    # neighbouring gray codes differ in one bit so every step adds or removes
+    # one element. removing swaps the last element into the gap, so the list
+    # is not in index order. the same list object is yielded each time, copy
+    # it to keep it
+    size = len(set)
+    if stop is None:
+        stop = 1 << size
+    gray = start ^ (start >> 1)
+    order = [i for i in range(size) if gray >> i & 1]
+    current = [set[i] for i in order]
+    # where every element sits in current, so removing it is O(1)
+    where = {i: position for position, i in enumerate(order)}
+    for step in range(start, stop):
+        yield current
+        if step + 1 == stop:
+            break
+        # gray(step + 1) differs from gray(step) at the lowest set bit of step + 1
+        bit = ((step + 1) & -(step + 1)).bit_length() - 1
+        if bit in where:
+            position = where.pop(bit)
+            lastbit = order.pop()
+            last = current.pop()
+            if lastbit != bit:
+                order[position] = lastbit
+                current[position] = last
+                where[lastbit] = position
+        else:
+            where[bit] = len(order)
+            order.append(bit)
+            current.append(set[bit])
+
+
+def writesubsets(set, out=None, start=0, stop=None, buffersize=1 << 16):
+    # one subset per line in gray code order, each line in index order like
+    # printPowerSet, written in large blocks. a line is read off the set bits
+    # of its gray code, so it costs the size of the subset
+    out = out or sys.stdout
+    if stop is None:
+        stop = 1 << len(set)
+    names = [str(element) for element in set]
+    lines = []
+    for step in range(start, stop):
+        gray = step ^ (step >> 1)
+        parts = []
+        while gray:
+            low = gray & -gray
+            parts.append(names[low.bit_length() - 1])
+            gray ^= low
+        lines.append(''.join(parts))
+        if len(lines) >= buffersize:
+            lines.append('')
+            out.write('\n'.join(lines))
+            lines = []
+    if lines:
+        lines.append('')
+        out.write('\n'.join(lines))
+
+
+def writepart(job):
+    set, start, stop, path = job
+    with open(path, 'w', buffering=1 << 20) as out:
+        writesubsets(set, out, start, stop)
+    return path
+
+
+def parallelpowerset(set, folder, prefixbits=None, workers=None):
+    # the 2^n steps are split by their top prefixbits bits, every worker walks
+    # one range and writes its own file. the files in order hold the whole
+    # gray code sequence
+    workers = workers or os.cpu_count() or 1
+    size = len(set)
+    if prefixbits is None:
+        prefixbits = min(size, max(1, (workers * 4 - 1).bit_length()))
+    parts = 1 << prefixbits
+    width = 1 << (size - prefixbits)
+    jobs = []
+    for part in range(parts):
+        path = os.path.join(folder, 'powerset_' + str(part).zfill(len(str(parts))) + '.txt')
+        jobs.append((set, part * width, (part + 1) * width, path))
+    with Pool(workers) as pool:
+        return pool.map(writepart, jobs)
+
+
+class SubsetSums:
+    # every reachable subset sum kept as one bit of a big int, bit s + offset
+    # stands for sum s. adding an element is one shift and one or, so the
+    # power set is never built. only every `step` th prefix is stored and the
+    # rest are recomputed when a witness subset is asked for
+
+    def __init__(self, numbers, step=None):
+        self.numbers = list(numbers)
+        size = len(self.numbers)
+        self.step = step or max(1, math.isqrt(size))
+        self.offsets = [0]
+        self.checkpoints = {0: 1}
+        reach = 1
+        offset = 0
+        for i, number in enumerate(self.numbers, 1):
+            reach, offset = self.add(reach, offset, number)
+            self.offsets.append(offset)
+            if i % self.step == 0:
+                self.checkpoints[i] = reach
+        self.reach = reach
+        self.offset = offset
+
+    @staticmethod
+    def add(reach, offset, number):
+        if number >= 0:
+            return reach | (reach << number), offset
+        return (reach << -number) | reach, offset - number
+
+    def reachable(self, target):
+        position = target + self.offset
+        return position >= 0 and bool(self.reach >> position & 1)
+
+    def reachablemany(self, targets):
+        return [self.reachable(target) for target in targets]
+
+    def count(self):
+        return self.reach.bit_count()
+
+    def prefixes(self, block):
+        # bitsets after block*step ... block*step + step elements
+        start = block * self.step
+        reach = self.checkpoints[start]
+        rows = [reach]
+        for i in range(start, min(start + self.step, len(self.numbers))):
+            reach = self.add(reach, self.offsets[i], self.numbers[i])[0]
+            rows.append(reach)
+        return rows
+
+    def witness(self, target):
+        # indexes of one subset adding up to target, None if there is none
+        if not self.reachable(target):
+            return None
+        chosen = []
+        i = len(self.numbers)
+        while i > 0:
+            block = (i - 1) // self.step
+            rows = self.prefixes(block)
+            start = block * self.step
+            while i > start:
+                before = rows[i - 1 - start]
+                position = target + self.offsets[i - 1]
+                if position < 0 or not before >> position & 1:
+                    target -= self.numbers[i - 1]
+                    chosen.append(i - 1)
+                i -= 1
+        chosen.reverse()
+        return chosen
+
+
+if __name__ == "__main__":
+    size=int(input('enter array size'))
+    set=[]
+    for i in range(0,size):
+        n = int(input('enter element'))
+        set.append(n)
+
+    printPowerSet(set,len(set))
@@ -1,23 +1,107 @@
-def rotation(a,n,a_size):
-    for i in range(n):
-        rotate(a,a_size)
+import array
 
-def rotate(a,a_size):
-    temp=a[0]
-    for i in  range(a_size)-1:
-          a[i]=a[i+1]
-          a[a,a_size -1]=temp
 
-def printarray(a,a_size-1)
-a[i]=a[i+1]
-a[a_size-1]=temp
+def reverserange(a, start, end):
+    # reverse a[start:end] in place
+    if isinstance(a, (list, array.array)):
+        a[start:end] = a[start:end][::-1]
+        return
+    end -= 1
+    while start < end:
+        a[start], a[end] = a[end], a[start]
+        start += 1
+        end -= 1
 
-a[12,12,31,80,2,5,53,56323]
-print array (a,len(a))
-rotations(a,2, len(a))
-printarray (a,len(a))
 
+def rotation(a, n, a_size):
+    # rotate left by n with three reversals: O(a_size) time, no extra list
+    # for memoryviews and only slice copies for lists and arrays
+    if a_size == 0:
+        return
+    n %= a_size
+    if n == 0:
+        return
+    reverserange(a, 0, n)
+    reverserange(a, n, a_size)
+    reverserange(a, 0, a_size)
 
 
-        
-        
\ No newline at end of file
+def gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def juggle(a, n, a_size):
+    # rotate left by n moving every element once, one temp value of memory
+    if a_size == 0:
+        return
+    n %= a_size
+    for start in range(gcd(n, a_size)):
+        temp = a[start]
+        i = start
+        while True:
+            j = i + n
+            if j >= a_size:
+                j -= a_size
+            if j == start:
+                break
+            a[i] = a[j]
+            i = j
+        a[i] = temp
+
+
+class RotatedView:
+    # a[shift:] + a[:shift] without copying. indices are kept as a range so
+    # slicing a view gives another view in O(1)
+
+    def __init__(self, base, shift=0, indices=None):
+        self.base = base
+        self.size = len(base)
+        self.shift = shift % self.size if self.size else 0
+        self.indices = range(self.size) if indices is None else indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def position(self, i):
+        return (self.shift + self.indices[i]) % self.size
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return RotatedView(self.base, self.shift, self.indices[i])
+        return self.base[self.position(i)]
+
+    def __setitem__(self, i, value):
+        self.base[self.position(i)] = value
+
+    def __iter__(self):
+        base, shift, size = self.base, self.shift, self.size
+        for i in self.indices:
+            i += shift
+            yield base[i - size if i >= size else i]
+
+    def rotate(self, n):
+        # rotating a whole view only moves its offset
+        if self.indices != range(self.size):
+            raise ValueError('only a whole view can be rotated')
+        return RotatedView(self.base, self.shift + n)
+
+    def tolist(self):
+        return list(self)
+
+    def __repr__(self):
+        return 'RotatedView(' + repr(self.tolist()) + ')'
+
+
+def printarray(a, a_size):
+    for i in range(a_size):
+        print(a[i], end=' ')
+    print()
+
+
+if __name__ == "__main__":
+    a = [12,12,31,80,2,5,53,56323]
+    printarray(a, len(a))
+    rotation(a, 2, len(a))
+    printarray(a, len(a))
@@ -1,3 +1,7 @@
+from collections import defaultdict
+from itertools import chain
+
+
 def subarraysum(arr,n,sum_):
     for i in range(n):
         curr_sum = arr[i]
@@ -14,7 +18,62 @@ def subarraysum(arr,n,sum_):
             j+=1
     print ('no subarray found')
     return 0
-arr=[3,6,2,2,56,1,0,9]
-n=len(arr)  
-sum_=10
-subarraysum(arr,n,sum_)
+
+
+# all of these take any iterable of numbers, negative ones too, and read it
+# once. a subarray start..end adds up to target exactly when
+# prefix(end + 1) - prefix(start) == target, so a map of the prefix sums seen
+# so far answers it at every step
+
+
+def firstsubarray(arr, target):
+    # (start, end) of the subarray that ends first, None if there is none
+    first = {0: 0}
+    prefix = 0
+    for i, value in enumerate(arr, 1):
+        prefix += value
+        start = first.get(prefix - target)
+        if start is not None:
+            return start, i - 1
+        first.setdefault(prefix, i)
+    return None
+
+
+def countsubarrays(arr, target):
+    counts = defaultdict(int)
+    counts[0] = 1
+    prefix = 0
+    found = 0
+    for value in arr:
+        prefix += value
+        found += counts[prefix - target]
+        counts[prefix] += 1
+    return found
+
+
+def itersubarrays(arr, target):
+    # yields every (start, end) as soon as its end is read
+    starts = defaultdict(list)
+    starts[0].append(0)
+    prefix = 0
+    for i, value in enumerate(arr, 1):
+        prefix += value
+        for start in starts.get(prefix - target, ()):
+            yield start, i - 1
+        starts[prefix].append(i)
+
+
+def chunkedsubarrays(chunks, target):
+    # the same over a stream of chunks, indexes count across chunks
+    return itersubarrays(chain.from_iterable(chunks), target)
+
+
+def chunkedcount(chunks, target):
+    return countsubarrays(chain.from_iterable(chunks), target)
+
+
+if __name__ == "__main__":
+    arr=[3,6,2,2,56,1,0,9]
+    n=len(arr)
+    sum_=10
+    subarraysum(arr,n,sum_)
@@ -1,3 +1,8 @@
+import sys
+
+from oddoccuring import twooddfile, twooddstream
+
+
 def TwoOdd(arr, size):
   xorof2 = arr[0]
   x = 0
@@ -15,8 +20,17 @@ def TwoOdd(arr, size):
 
   print("TwoOdd elements are",x,"&",y)
 
-arr = []
-arr_size = int(input("Enter the size of the array"))
-for i in range(0,arr_size):
-  z = int(input("Enter element"))
-  arr.append(z)
\ No newline at end of file
+if __name__ == "__main__":
+  if len(sys.argv) > 1:
+    if sys.argv[1] == '-':
+      x, y = twooddstream(sys.stdin.buffer)
+    else:
+      x, y = twooddfile(sys.argv[1])
+    print("TwoOdd elements are",x,"&",y)
+  else:
+    arr = []
+    arr_size = int(input("Enter the size of the array"))
+    for i in range(0,arr_size):
+      z = int(input("Enter element"))
+      arr.append(z)
+    TwoOdd(arr, arr_size)
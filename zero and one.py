@@ -1,3 +1,6 @@
+from numberofbits import bitstats
+
+
 def numberofbits(n):
     ones=0
     zeros=0
@@ -9,5 +12,14 @@ def numberofbits(n):
 
         n >>= 1
     print(' ones=',ones,' zeros',zeros)
-number = int(input('enter your number'))
-numberofbits(number)
+
+
+def onesandzeros(numbers):
+    # same counts as numberofbits for a whole list, array or buffer at once
+    stats = bitstats(numbers)
+    return stats['ones'], stats['zeros']
+
+
+if __name__ == "__main__":
+    number = int(input('enter your number'))
+    numberofbits(number)
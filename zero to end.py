@@ -1,3 +1,13 @@
+import array
+import shutil
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def pushzerotoend(a,a_size):
     zero=0
     nonzero=0
@@ -8,9 +18,65 @@ def pushzerotoend(a,a_size):
             zero+=1
         nonzero+=1
 
-a=[1,0,3,6,0,0,0,2,352,0,72]
-a_size= len(a)
-print(a)
-pushzerotoend(a, a_size)
-print('array after pushing 0 to end :')
-print(a)
\ No newline at end of file
+
+def compact(a, predicate=None, value=0):
+    # moves every matching value (equal to value, or predicate(x) true) to
+    # the end in place, the other values keep their order. returns how many
+    # values were kept at the front
+    if np is not None and isinstance(a, np.ndarray):
+        mask = predicate(a) if predicate else a == value
+        kept = a[~mask]
+        moved = a[mask]
+        a[:len(kept)] = kept
+        a[len(kept):] = moved
+        return len(kept)
+    if predicate is None:
+        # the moved values are all the same, so only the count is needed
+        kept = [x for x in a if x != value]
+        count = len(kept)
+        tail = [value] * (len(a) - count)
+        if isinstance(a, array.array):
+            kept = array.array(a.typecode, kept)
+            tail = array.array(a.typecode, tail)
+        a[:count] = kept
+        a[count:] = tail
+        return count
+    kept = 0
+    for i in range(len(a)):
+        if not predicate(a[i]):
+            a[i], a[kept] = a[kept], a[i]
+            kept += 1
+    return kept
+
+
+def compactfile(source, target, typecode='d', predicate=None, value=0, chunksize=1 << 20):
+    # compacts a binary file of array typecode values into target a chunk at
+    # a time. kept values are written straight away, matching ones spill to
+    # a temporary file that is appended at the end. returns the spill count
+    itemsize = array.array(typecode).itemsize
+    spilled = 0
+    with open(source, 'rb') as infile, open(target, 'wb') as outfile, tempfile.TemporaryFile() as spill:
+        while True:
+            data = infile.read(chunksize * itemsize)
+            if not data:
+                break
+            if len(data) % itemsize:
+                raise ValueError('file size is not a whole number of values')
+            chunk = array.array(typecode)
+            chunk.frombytes(data)
+            kept = compact(chunk, predicate, value)
+            outfile.write(chunk[:kept].tobytes())
+            spill.write(chunk[kept:].tobytes())
+            spilled += len(chunk) - kept
+        spill.seek(0)
+        shutil.copyfileobj(spill, outfile)
+    return spilled
+
+
+if __name__ == "__main__":
+    a=[1,0,3,6,0,0,0,2,352,0,72]
+    a_size= len(a)
+    print(a)
+    pushzerotoend(a, a_size)
+    print('array after pushing 0 to end :')
+    print(a)